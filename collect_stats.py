@@ -4,59 +4,146 @@ Moltbot Analytics - Data Collector
 Collects Reddit and GitHub stats for the dashboard
 """
 
-import json
+import hashlib
+import os
+import orjson
 import requests
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import pygit2
+except ImportError:  # fall back to the git CLI
+    pygit2 = None
+
+GIT_ERRORS = (subprocess.CalledProcessError,)
+if pygit2 is not None:
+    GIT_ERRORS += (pygit2.GitError,)
 
 # Configuration
 SUBREDDITS = ['clawdbot', 'moltbot', 'moltbothub', 'moltbothq', 'moltbotcommunity']
 GITHUB_REPO = 'anthropics/claude-code'
 DATA_FILE = Path(__file__).parent / 'data.json'
-HISTORY_FILE = Path(__file__).parent / 'history.json'
+HISTORY_FILE = Path(__file__).parent / 'history.ndjson'  # one JSON entry per line
+HISTORY_LIMIT = 1000        # entries kept (index.html slices to the same window)
+HISTORY_COMPACT_AT = 1200   # lines on disk before the file is rewritten to the last HISTORY_LIMIT
+ETAG_FILE = Path(__file__).parent / 'etags.json'
+LAST_HASH_FILE = Path(__file__).parent / '.last_hash'  # payload hash of the last push
+REPO_DIR = Path(__file__).parent
+GIT_FILES = [DATA_FILE.name, HISTORY_FILE.name]  # files committed on each run
+
+# Output - compact JSON unless PRETTY=1 asks for human-readable dumps
+JSON_OPTS = orjson.OPT_INDENT_2 if os.environ.get('PRETTY') == '1' else 0
+
+# Per-subreddit history field names, e.g. HIST_KEYS['moltbot']['subs'] == 'moltbot_subs'
+HIST_KEYS = {
+    s: {f: f'{s}_{f}' for f in ('subs', 'active', 'posts', 'upvotes', 'comments')}
+    for s in SUBREDDITS
+}
 
 # Timezone
 TZ = timezone(timedelta(hours=8))  # GMT+8
 
+# HTTP - one pooled session shared by all fetches so TCP/TLS is reused
+USER_AGENT = 'MoltbotAnalytics/1.0'  # Reddit rate-limits generic agents with 429s
+MAX_WORKERS = len(SUBREDDITS) * 2 + 1  # about + hot per subreddit, plus GitHub
+HTTP_TIMEOUT = (3, 10)  # (connect, read) seconds - fail fast on a stuck handshake
+HTTP_RETRY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_status=False,  # a long Retry-After on 429 would stall the run
+    raise_on_status=False  # hand the final bad status back to the caller
+)
+
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=HTTP_RETRY))
+
+
+def _conditional_headers(validators: dict) -> dict:
+    """Build If-None-Match / If-Modified-Since headers from cached validators"""
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+
+def _remember_validators(etags: dict, key: str, resp: requests.Response):
+    """Store the ETag / Last-Modified of a 200 response for the next run"""
+    validators = {
+        'etag': resp.headers.get('ETag'),
+        'last_modified': resp.headers.get('Last-Modified')
+    }
+    validators = {k: v for k, v in validators.items() if v}
+    if validators:
+        etags[key] = validators
+    else:
+        etags.pop(key, None)
+
 
-def fetch_subreddit_stats(subreddit: str) -> dict:
-    """Fetch stats for a subreddit using public JSON endpoint"""
+def _fetch_about(subreddit: str, etags: dict, cached: dict = None,
+                 session: requests.Session = SESSION) -> dict:
+    """Fetch subreddit about.json (subscriber counts)
+    
+    If `cached` holds last run's values, the request is made conditional and
+    a 304 reuses them instead of downloading the body again. Any failure drops
+    the stored validator, since this run's data.json then carries fallback
+    values that a later 304 must not resurrect.
+    """
     try:
-        # About endpoint for subscriber count
-        about_url = f'https://www.reddit.com/r/{subreddit}/about.json'
-        headers = {'User-Agent': 'MoltbotAnalytics/1.0'}
-        
-        resp = requests.get(about_url, headers=headers, timeout=10)
+        url = f'https://www.reddit.com/r/{subreddit}/about.json'
+        headers = _conditional_headers(etags.get(subreddit, {})) if cached else {}
+        resp = session.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        if resp.status_code == 304:
+            return cached
         if resp.status_code != 200:
             print(f"  ⚠️ r/{subreddit} about: HTTP {resp.status_code}")
+            etags.pop(subreddit, None)
             return None
-            
-        about = resp.json().get('data', {})
-        
-        # Hot posts for activity metrics
-        hot_url = f'https://www.reddit.com/r/{subreddit}/hot.json?limit=100'
-        resp = requests.get(hot_url, headers=headers, timeout=10)
-        posts_data = resp.json().get('data', {}).get('children', []) if resp.status_code == 200 else []
-        
+        about = orjson.loads(resp.content).get('data', {})
+        _remember_validators(etags, subreddit, resp)
+        return about
+    except Exception as e:
+        print(f"  ❌ r/{subreddit}: {e}")
+        etags.pop(subreddit, None)
+        return None
+
+
+def _fetch_hot(subreddit: str, session: requests.Session = SESSION) -> list:
+    """Fetch subreddit hot.json (recent posts for activity metrics)"""
+    try:
+        url = f'https://www.reddit.com/r/{subreddit}/hot.json?limit=100'
+        resp = session.get(url, timeout=HTTP_TIMEOUT)
+        if resp.status_code != 200:
+            return []
+        return orjson.loads(resp.content).get('data', {}).get('children', [])
+    except Exception as e:
+        print(f"  ❌ r/{subreddit} hot: {e}")
+        return []
+
+
+def build_subreddit_stats(subreddit: str, about: dict, posts_data: list) -> dict:
+    """Build stats for a subreddit from its about.json and hot.json payloads"""
+    try:
         # Calculate 24h stats
         now = datetime.now(timezone.utc).timestamp()
         day_ago = now - 86400
         
-        posts_24h = 0
-        comments_24h = 0
-        upvotes_24h = 0
-        top_score = 0
-        
-        for post in posts_data:
-            p = post.get('data', {})
-            created = p.get('created_utc', 0)
-            if created > day_ago:
-                posts_24h += 1
-                comments_24h += p.get('num_comments', 0)
-                score = p.get('score', 0)
-                upvotes_24h += score
-                top_score = max(top_score, score)
+        fresh = [p['data'] for p in posts_data if p.get('data', {}).get('created_utc', 0) > day_ago]
+        posts_24h = len(fresh)
+        comments_24h = sum(p.get('num_comments', 0) for p in fresh)
+        scores = [p.get('score', 0) for p in fresh]
+        upvotes_24h = sum(scores)
+        top_score = max([0, *scores])
         
         return {
             'name': f'r/{subreddit}',
@@ -75,18 +162,25 @@ def fetch_subreddit_stats(subreddit: str) -> dict:
         return None
 
 
-def fetch_github_stats() -> dict:
-    """Fetch GitHub repo stats"""
+def fetch_github_stats(etags: dict, cached: dict = None,
+                       session: requests.Session = SESSION) -> dict:
+    """Fetch GitHub repo stats (conditional on last run's ETag, like about.json)"""
     try:
         url = f'https://api.github.com/repos/{GITHUB_REPO}'
         headers = {'Accept': 'application/vnd.github.v3+json'}
+        if cached:
+            headers.update(_conditional_headers(etags.get('github', {})))
         
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = session.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        if resp.status_code == 304:
+            return cached
         if resp.status_code != 200:
             print(f"  ⚠️ GitHub: HTTP {resp.status_code}")
+            etags.pop('github', None)
             return None
             
-        data = resp.json()
+        data = orjson.loads(resp.content)
+        _remember_validators(etags, 'github', resp)
         return {
             'stars': data.get('stargazers_count', 0),
             'forks': data.get('forks_count', 0),
@@ -94,41 +188,189 @@ def fetch_github_stats() -> dict:
         }
     except Exception as e:
         print(f"  ❌ GitHub: {e}")
+        etags.pop('github', None)
+        return None
+
+
+def write_atomic(path: Path, payload: bytes):
+    """Write via a temp file + os.replace so readers never see a partial file"""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def _git_show(path: Path) -> bytes:
+    """Committed copy of a repo file at HEAD, or None if git can't provide it"""
+    try:
+        return subprocess.check_output(
+            ['git', 'show', f'HEAD:{path.name}'], cwd=REPO_DIR, stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.CalledProcessError):
         return None
 
 
-def load_history() -> list:
-    """Load history data"""
-    if HISTORY_FILE.exists():
+def _parse_history(lines) -> tuple:
+    """Parse NDJSON history lines, skipping corrupt ones (e.g. a torn last append)
+    
+    Returns the last HISTORY_LIMIT entries and the number of lines read, so
+    appending can decide on compaction without reading the file again.
+    """
+    history = deque(maxlen=HISTORY_LIMIT)
+    count = 0
+    corrupt = 0
+    for line in lines:
+        count += 1
+        if not line.strip():
+            continue
         try:
-            with open(HISTORY_FILE) as f:
-                return json.load(f)
-        except:
-            pass
-    return []
+            history.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            corrupt += 1
+    if corrupt:
+        print(f"  ⚠️ {HISTORY_FILE.name}: skipped {corrupt} corrupt line(s)")
+    return history, count
+
+
+def _dump_history(history) -> bytes:
+    """Serialize history entries as NDJSON"""
+    return b''.join(orjson.dumps(e) + b'\n' for e in history)
+
+
+def load_history() -> tuple:
+    """Load the last HISTORY_LIMIT history entries and the file's line count"""
+    if not HISTORY_FILE.exists():
+        return deque(maxlen=HISTORY_LIMIT), 0
+    try:
+        with open(HISTORY_FILE, 'rb') as f:
+            return _parse_history(f)
+    except OSError as e:
+        print(f"  ⚠️ {HISTORY_FILE.name} read failed: {e} - restoring from git HEAD")
+    history, _ = _parse_history((_git_show(HISTORY_FILE) or b'').splitlines())
+    # Put the recovered copy back on disk now, so appending later can't hit the
+    # same unreadable file after data.json has already been replaced
+    write_atomic(HISTORY_FILE, _dump_history(history))
+    return history, len(history)
+
+
+def _repair_tail(f):
+    """Make the file end on a newline before appending
+    
+    A last line without one is either a complete entry that only lacks its
+    newline (kept) or a torn, interrupted append (cut back to the line before).
+    """
+    end = f.seek(0, os.SEEK_END)
+    if not end:
+        return
+    f.seek(end - 1)
+    if f.read(1) == b'\n':
+        return
+    start = 0
+    pos = end
+    while pos > 0:
+        step = min(4096, pos)
+        pos -= step
+        f.seek(pos)
+        newline = f.read(step).rfind(b'\n')
+        if newline != -1:
+            start = pos + newline + 1
+            break
+    f.seek(start)
+    try:
+        orjson.loads(f.read(end - start))
+    except orjson.JSONDecodeError:
+        f.truncate(start)
+    else:
+        f.write(b'\n')
+
+
+def append_history(entry: dict, history: deque, lines: int):
+    """Append one entry to the history file, compacting it once it grows too long
+    
+    `lines` is the line count load_history() saw, so no re-read is needed.
+    """
+    with open(HISTORY_FILE, 'ab+') as f:
+        # Keep the committed file valid NDJSON even after an interrupted append
+        _repair_tail(f)
+        f.write(orjson.dumps(entry) + b'\n')
+    
+    if lines + 1 > HISTORY_COMPACT_AT:
+        write_atomic(HISTORY_FILE, _dump_history(history))
+
+
+def load_etags() -> dict:
+    """Load cached HTTP validators (ETag / Last-Modified) keyed by endpoint"""
+    if ETAG_FILE.exists():
+        try:
+            return orjson.loads(ETAG_FILE.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            print(f"  ⚠️ {ETAG_FILE.name} unreadable, fetching unconditionally: {e}")
+    return {}
+
+
+def save_etags(etags: dict):
+    """Persist HTTP validators for the next run"""
+    write_atomic(ETAG_FILE, orjson.dumps(etags, option=JSON_OPTS))
+
+
+def payload_hash(data: dict) -> str:
+    """Hash of the data payload, ignoring the fields that change on every run"""
+    stable = {k: v for k, v in data.items() if not k.startswith('timestamp') and k != 'data_points'}
+    return hashlib.blake2b(orjson.dumps(stable, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def load_last_hash() -> str:
+    """Payload hash recorded after the last successful push"""
+    if LAST_HASH_FILE.exists():
+        return LAST_HASH_FILE.read_text().strip()
+    return ''
 
 
 def load_previous_data() -> dict:
     """Load previous data for delta calculation"""
     if DATA_FILE.exists():
         try:
-            with open(DATA_FILE) as f:
-                return json.load(f)
-        except:
-            pass
+            return orjson.loads(DATA_FILE.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            print(f"  ⚠️ {DATA_FILE.name} read failed: {e} - restoring from git HEAD")
+        blob = _git_show(DATA_FILE)
+        if blob:
+            try:
+                return orjson.loads(blob)
+            except orjson.JSONDecodeError:
+                pass
     return {}
 
 
 def collect_all_stats():
-    """Collect all stats and update files"""
+    """Collect all stats and update files; returns None if nothing changed"""
     print(f"🦞 Moltbot Analytics - Collecting stats...")
     print(f"   {datetime.now(TZ).strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Load previous data for deltas
+    # Load previous data for deltas, and history once for the whole run
     prev = load_previous_data()
+    history, history_lines = load_history()
     prev_reddit = prev.get('reddit', {})
     prev_github = prev.get('github', {})
     
+    # Previous values to fall back on when an endpoint answers 304 Not Modified
+    etags = load_etags()
+    cached_about = {
+        s['key']: {'subscribers': s['subscribers'], 'accounts_active': s['active']}
+        for s in prev_reddit.get('subreddits', [])
+    }
+    cached_github = None
+    if {'stars', 'forks', 'open_issues'} <= prev_github.keys():
+        cached_github = {k: prev_github[k] for k in ('stars', 'forks', 'open_issues')}
+    
+    # Fire all Reddit + GitHub requests concurrently over the shared session
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        about_futures = {
+            sub: pool.submit(_fetch_about, sub, etags, cached_about.get(sub))
+            for sub in SUBREDDITS
+        }
+        hot_futures = {sub: pool.submit(_fetch_hot, sub) for sub in SUBREDDITS}
+        github_future = pool.submit(fetch_github_stats, etags, cached_github)
+    
     # Collect Reddit stats
     print("\n📱 Reddit:")
     subreddit_stats = []
@@ -137,9 +379,13 @@ def collect_all_stats():
     total_posts = 0
     total_comments = 0
     total_upvotes = 0
+    sub_history = {}  # per-subreddit history fields, filled in the same pass
     
     for sub in SUBREDDITS:
-        stats = fetch_subreddit_stats(sub)
+        about = about_futures[sub].result()
+        if about is None:
+            continue
+        stats = build_subreddit_stats(sub, about, hot_futures[sub].result())
         if stats:
             subreddit_stats.append(stats)
             total_subs += stats['subscribers']
@@ -147,16 +393,26 @@ def collect_all_stats():
             total_posts += stats['posts_24h']
             total_comments += stats['comments']
             total_upvotes += stats['total_upvotes']
+            keys = HIST_KEYS[sub]
+            sub_history[keys['subs']] = stats['subscribers']
+            sub_history[keys['active']] = stats['active']
+            sub_history[keys['posts']] = stats['posts_24h']
+            sub_history[keys['upvotes']] = stats['total_upvotes']
+            sub_history[keys['comments']] = stats['comments']
             print(f"  ✅ r/{sub}: {stats['subscribers']:,} subs, {stats['posts_24h']} posts/24h")
     
     # Collect GitHub stats
     print("\n🐙 GitHub:")
-    github = fetch_github_stats()
-    if github:
+    github = github_future.result()
+    github_ok = github is not None
+    if github_ok:
         print(f"  ✅ {GITHUB_REPO}: ⭐ {github['stars']:,} | 🍴 {github['forks']:,}")
     else:
         github = {'stars': 0, 'forks': 0, 'open_issues': 0}
     
+    # A run that fell back on placeholder values must never count as "unchanged"
+    complete = github_ok and len(subreddit_stats) == len(SUBREDDITS)
+    
     # Build data object
     now = datetime.now(TZ)
     now_utc = datetime.now(timezone.utc)
@@ -164,7 +420,7 @@ def collect_all_stats():
     data = {
         'timestamp': now_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
         'timestamp_local': now.strftime('%Y-%m-%d %H:%M:%S'),
-        'data_points': len(load_history()) + 1,
+        'data_points': len(history) + 1,
         'reddit': {
             'total_subscribers': total_subs,
             'delta_subscribers': total_subs - prev_reddit.get('total_subscribers', total_subs),
@@ -183,13 +439,19 @@ def collect_all_stats():
         }
     }
     
+    # Nothing moved since the last push - skip writing and committing
+    if complete and payload_hash(data) == load_last_hash():
+        print(f"\n⏸️ No changes since last push, skipping")
+        save_etags(etags)
+        return None
+    
     # Save current data
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_atomic(DATA_FILE, orjson.dumps(data, option=JSON_OPTS))
     print(f"\n💾 Saved data.json")
+    # Only after data.json holds the values a future 304 will fall back on
+    save_etags(etags)
     
     # Append to history
-    history = load_history()
     history_entry = {
         'timestamp': now.isoformat(),
         'time_local': now.strftime('%m/%d %H:%M'),
@@ -198,50 +460,117 @@ def collect_all_stats():
         'reddit_posts': total_posts,
         'reddit_comments': total_comments,
         'reddit_upvotes': total_upvotes,
+        **sub_history,
+        'github_stars': github['stars'],
+        'github_forks': github['forks'],
+        'github_issues': github['open_issues'],
     }
     
-    # Add per-subreddit data
-    for stats in subreddit_stats:
-        key = stats['key']
-        history_entry[f'{key}_subs'] = stats['subscribers']
-        history_entry[f'{key}_active'] = stats['active']
-        history_entry[f'{key}_posts'] = stats['posts_24h']
-        history_entry[f'{key}_upvotes'] = stats['total_upvotes']
-        history_entry[f'{key}_comments'] = stats['comments']
-    
-    history_entry['github_stars'] = github['stars']
-    history_entry['github_forks'] = github['forks']
-    history_entry['github_issues'] = github['open_issues']
-    
+    # deque(maxlen=HISTORY_LIMIT) drops the oldest entry once full
     history.append(history_entry)
+    append_history(history_entry, history, history_lines)
+    print(f"📊 Updated history.ndjson ({len(history)} entries)")
     
-    # Keep only last 1000 entries
-    if len(history) > 1000:
-        history = history[-1000:]
+    return data
+
+
+_repo = None
+
+
+def _open_repo():
+    """Open the pygit2 repository once and reuse the handle"""
+    global _repo
+    if _repo is None:
+        _repo = pygit2.Repository(str(REPO_DIR))
+    return _repo
+
+
+if pygit2 is not None:
+    class _PushCallbacks(pygit2.RemoteCallbacks):
+        """Push callbacks that fail loudly instead of retrying or ignoring rejections"""
+        
+        def __init__(self):
+            super().__init__()
+            self._credentials_tried = False
+        
+        def credentials(self, url, username_from_url, allowed_types):
+            """GITHUB_TOKEN over HTTPS, else the SSH agent - offered once only
+            
+            libgit2 asks again after every failed attempt, so a second call
+            means the credential was refused.
+            """
+            if self._credentials_tried:
+                raise pygit2.GitError(f'authentication failed for {url}')
+            self._credentials_tried = True
+            
+            CredentialType = pygit2.enums.CredentialType
+            token = os.environ.get('GITHUB_TOKEN')
+            if token and allowed_types & CredentialType.USERPASS_PLAINTEXT:
+                return pygit2.UserPass('x-access-token', token)
+            if allowed_types & CredentialType.SSH_KEY:
+                return pygit2.KeypairFromAgent(username_from_url or 'git')
+            raise pygit2.GitError(f'no usable credentials for {url}')
+        
+        def push_update_reference(self, refname, message):
+            """libgit2 reports server-side rejections here rather than raising"""
+            if message is not None:
+                raise pygit2.GitError(f'remote rejected {refname}: {message}')
+
+
+def _git_push_pygit2(message: str):
+    """Stage and commit in-process via libgit2, then push
     
-    with open(HISTORY_FILE, 'w') as f:
-        json.dump(history, f, indent=2)
-    print(f"📊 Updated history.json ({len(history)} entries)")
+    The push falls back to `git push` if libgit2 can't authenticate or the
+    remote rejects the ref, so the user's credential helper and SSH config
+    still work without GITHUB_TOKEN and a rejection still fails the run.
+    """
+    repo = _open_repo()
+    try:
+        sig = repo.default_signature
+    except KeyError as e:
+        raise pygit2.GitError(f'no git identity configured: {e}') from e
+    try:
+        origin = repo.remotes['origin']
+    except KeyError as e:
+        raise pygit2.GitError("no 'origin' remote") from e
     
-    return data
+    repo.index.add_all(GIT_FILES)
+    repo.index.write()
+    tree = repo.index.write_tree()
+    repo.create_commit('HEAD', sig, sig, message, tree, [repo.head.target])
+    
+    try:
+        origin.push([repo.head.name], callbacks=_PushCallbacks())
+    except pygit2.GitError as e:
+        print(f"  ⚠️ libgit2 push failed ({e}), retrying with git CLI")
+        subprocess.run(['git', 'push'], cwd=REPO_DIR, check=True)
+
 
+def _git_push_cli(message: str):
+    """Stage, commit and push with the git CLI"""
+    subprocess.run(['git', 'add', '--', *GIT_FILES], cwd=REPO_DIR, check=True)
+    subprocess.run(['git', 'commit', '-m', message], cwd=REPO_DIR, check=True)
+    subprocess.run(['git', 'push'], cwd=REPO_DIR, check=True)
 
-def git_push():
-    """Commit and push changes"""
+
+def git_push(data_hash: str = None):
+    """Commit and push changes, recording `data_hash` once the push succeeds"""
+    now = datetime.now(TZ).strftime('%Y-%m-%d %H:%M:%S')
     try:
-        repo_dir = Path(__file__).parent
-        now = datetime.now(TZ).strftime('%Y-%m-%d %H:%M:%S')
-        
-        subprocess.run(['git', 'add', '-A'], cwd=repo_dir, check=True)
-        subprocess.run(['git', 'commit', '-m', f'Update {now}'], cwd=repo_dir, check=True)
-        subprocess.run(['git', 'push'], cwd=repo_dir, check=True)
+        if pygit2 is not None:
+            _git_push_pygit2(f'Update {now}')
+        else:
+            _git_push_cli(f'Update {now}')
         print(f"🚀 Pushed to GitHub")
+        if data_hash:
+            LAST_HASH_FILE.write_text(data_hash)
         return True
-    except subprocess.CalledProcessError as e:
+    except GIT_ERRORS as e:
         print(f"⚠️ Git push failed: {e}")
         return False
 
 
 if __name__ == '__main__':
-    collect_all_stats()
-    git_push()
+    data = collect_all_stats()
+    if data:
+        git_push(payload_hash(data))